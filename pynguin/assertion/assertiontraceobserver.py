@@ -7,7 +7,7 @@
 """Provides an abstract observer that can be used to generate assertions."""
 import copy
 from types import ModuleType
-from typing import cast
+from typing import Any, TypeVar, cast
 
 import pynguin.assertion.assertion as ass
 import pynguin.assertion.assertion_trace as at
@@ -23,6 +23,8 @@ from pynguin.utils.type_utils import (
     is_primitive_type,
 )
 
+_F = TypeVar("_F", bound=gao.GenericAbstractField)
+
 
 class AssertionTraceObserver(ex.ExecutionObserver):
     """Observer that creates assertions.
@@ -31,11 +33,31 @@ class AssertionTraceObserver(ex.ExecutionObserver):
     def __init__(self) -> None:
         self._trace: at.AssertionTrace = at.AssertionTrace()
         self._watch_list: list[vr.VariableReference] = []
+        # The same fields are observed after every statement, thus equal fields share
+        # one instance during an execution, such that comparing them is cheap.
+        self._fields: dict[tuple[Any, ...], gao.GenericAbstractField] = {}
 
     def clear(self) -> None:
         """Clear the existing gathered trace."""
         self._trace.clear()
         self._watch_list.clear()
+        self._fields.clear()
+
+    def _get_field(self, kind: type[_F], *args: Any) -> _F:
+        """Provides the shared instance of a field for the current execution.
+
+        Args:
+            kind: The class of the field
+            *args: The arguments to create the field with
+
+        Returns:
+            The shared field instance
+        """
+        key = (kind, *args)
+        field = self._fields.get(key)
+        if field is None:
+            field = self._fields[key] = kind(*args)
+        return cast(_F, field)
 
     def get_trace(self) -> at.AssertionTrace:
         """Get a copy of the gathered trace.
@@ -105,7 +127,12 @@ class AssertionTraceObserver(ex.ExecutionObserver):
                 self._check_reference(
                     exec_ctx,
                     vr.StaticModuleFieldReference(
-                        gao.GenericStaticModuleField(module_name, field, type(value))
+                        self._get_field(
+                            gao.GenericStaticModuleField,
+                            module_name,
+                            field,
+                            type(value),
+                        )
                     ),
                     position,
                 )
@@ -126,7 +153,9 @@ class AssertionTraceObserver(ex.ExecutionObserver):
                 self._check_reference(
                     exec_ctx,
                     vr.StaticFieldReference(
-                        gao.GenericStaticField(seen_type, field, type(value))
+                        self._get_field(
+                            gao.GenericStaticField, seen_type, field, type(value)
+                        )
                     ),
                     position,
                 )
@@ -171,7 +200,10 @@ class AssertionTraceObserver(ex.ExecutionObserver):
                     self._check_reference(
                         exec_ctx,
                         vr.FieldReference(
-                            ref, gao.GenericField(type(value), field, type(field_value))
+                            ref,
+                            self._get_field(
+                                gao.GenericField, type(value), field, type(field_value)
+                            ),
                         ),
                         position,
                         depth + 1,
@@ -7,7 +7,7 @@
 """Provides a comparator for dominance comparisons."""
 from __future__ import annotations
 
-from typing import Generic, TypeVar
+from typing import Collection, Generic, TypeVar
 
 from ordered_set import OrderedSet
 
@@ -25,10 +25,10 @@ class DominanceComparator(Generic[C]):
         self,
         *,
         goal: ff.FitnessFunction | None = None,
-        goals: OrderedSet[ff.FitnessFunction] | None = None,
+        goals: Collection[ff.FitnessFunction] | None = None,
     ) -> None:
         if goals is not None:
-            self._objectives: OrderedSet[ff.FitnessFunction] | None = goals
+            self._objectives: Collection[ff.FitnessFunction] | None = goals
         elif goal is not None:
             self._objectives = OrderedSet({goal})
         else:
@@ -20,6 +20,24 @@ if TYPE_CHECKING:
     from pynguin.testcase.execution import ExecutionResult, KnownData, TestCaseExecutor
 
 
+def run_test_case_chromosome(executor: TestCaseExecutor, individual) -> ExecutionResult:
+    """Runs a test case chromosome, unless its execution result is up to date.
+
+    Args:
+        executor: The executor to run the test case with
+        individual: The individual to run
+
+    Returns:
+        The execution result of the individual
+    """
+    if individual.has_changed() or individual.get_last_execution_result() is None:
+        individual.set_last_execution_result(executor.execute(individual.test_case))
+        individual.set_changed(False)
+    result = individual.get_last_execution_result()
+    assert result is not None
+    return result
+
+
 @dataclasses.dataclass(eq=False)
 class ChromosomeComputation(abc.ABC):  # pylint:disable=too-few-public-methods
     """An abstract computation on chromosomes."""
@@ -43,14 +61,7 @@ class TestCaseChromosomeComputation(
         Returns:
             A list of execution results
         """
-        if individual.has_changed() or individual.get_last_execution_result() is None:
-            individual.set_last_execution_result(
-                self._executor.execute(individual.test_case)
-            )
-            individual.set_changed(False)
-        result = individual.get_last_execution_result()
-        assert result is not None
-        return result
+        return run_test_case_chromosome(self._executor, individual)
 
 
 class TestSuiteChromosomeComputation(
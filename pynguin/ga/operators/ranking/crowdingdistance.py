@@ -7,10 +7,9 @@
 """Provides various crowding-distance assignment implementations."""
 from __future__ import annotations
 
-import sys
-from typing import TYPE_CHECKING, TypeVar
-
-from ordered_set import OrderedSet
+import heapq
+from itertools import compress
+from typing import TYPE_CHECKING, Iterable, TypeVar
 
 import pynguin.ga.chromosome as chrom
 
@@ -21,8 +20,8 @@ C = TypeVar("C", bound=chrom.Chromosome)  # pylint: disable=invalid-name
 
 
 def fast_epsilon_dominance_assignment(
-    front: list[C], goals: OrderedSet[ff.FitnessFunction]
-) -> None:
+    front: list[C], goals: Iterable[ff.FitnessFunction]
+) -> list[float]:
     """Implements a "fast" version of the variant of the crowding distance.
 
     It is named "epsilon-dominance-assignment" and was proposed by Köppen and Yoshida in
@@ -33,30 +32,94 @@ def fast_epsilon_dominance_assignment(
     Args:
         front: Front of non-dominated solutions/tests
         goals: Set of goals/targets (e.g., branches) to consider
+
+    Returns:
+        The assigned distances, aligned with the solutions of the front
     """
-    for test in front:
-        test.distance = 0
-
-    for goal in goals:
-        minimum = sys.float_info.max
-        min_set: list[C] = []
-        maximum = 0.0
-        for test in front:
-            value = test.get_fitness_for(goal)
-            if value < minimum:
-                minimum = value
-                min_set.clear()
-                min_set.append(test)
-            elif value == minimum:
-                min_set.append(test)
-
-            if value > maximum:
-                maximum = value
-
-        if maximum == minimum:
-            continue
+    if not front:
+        return []
+    distances = _epsilon_distances(_fitness_matrix(front, goals), len(front))
+    for test, distance in zip(front, distances):
+        test.distance = distance
+    return distances
+
+
+def fast_epsilon_dominance_assignment_for_fronts(
+    fronts: Iterable[list[C]], goals: Iterable[ff.FitnessFunction]
+) -> list[list[float]]:
+    """Applies the epsilon-dominance assignment to several fronts in one batch.
+
+    The goals are only resolved once for all fronts, instead of once per front.
+
+    Args:
+        fronts: The fronts of non-dominated solutions/tests
+        goals: Set of goals/targets (e.g., branches) to consider
+
+    Returns:
+        The assigned distances of each front, aligned with its solutions
+    """
+    goal_list = list(goals)
+    return [fast_epsilon_dominance_assignment(front, goal_list) for front in fronts]
+
+
+def select_most_distant(front: list[C], distances: list[float], count: int) -> list[C]:
+    """Selects the solutions of a front with the largest distances.
+
+    The order equals that of sorting the front by descending distance, i.e., ties
+    keep their order from the front.  Only the plain distance values are compared,
+    instead of reading the distance attribute of each solution during the sort.
+
+    Args:
+        front: Front of solutions/tests
+        distances: The distances of the solutions, aligned with the front
+        count: The number of solutions to select
 
-        for test in min_set:
-            numerator = len(front) - len(min_set)
-            denominator = len(front)
-            test.distance = max(test.distance, numerator / denominator)
+    Returns:
+        The selected solutions, ordered by descending distance
+    """
+    indices = heapq.nlargest(count, range(len(front)), key=distances.__getitem__)
+    return [front[index] for index in indices]
+
+
+def _fitness_matrix(
+    front: list[C], goals: Iterable[ff.FitnessFunction]
+) -> list[list[float]]:
+    """Collects the fitness values of a front, one column per goal.
+
+    Args:
+        front: Front of non-dominated solutions/tests
+        goals: The goals/targets to consider
+
+    Returns:
+        A list that contains, for each goal, the fitness values of the front
+    """
+    return [[test.get_fitness_for(goal) for test in front] for goal in goals]
+
+
+def _epsilon_distances(columns: list[list[float]], size: int) -> list[float]:
+    """Computes the epsilon-dominance distances from a fitness matrix.
+
+    For every goal, the solutions with the minimal fitness value get a distance that
+    corresponds to the fraction of solutions that are not minimal for that goal.  The
+    distance of a solution is the maximum over all goals.
+
+    Args:
+        columns: The fitness values of the front, one column per goal
+        size: The size of the front
+
+    Returns:
+        The distance for each solution of the front
+    """
+    distances = [0.0] * size
+    solution_indices = range(size)
+    for column in columns:
+        minimum = min(column)
+        num_minimal = column.count(minimum)
+        if num_minimal == size:
+            # All values are equal, i.e., maximum == minimum
+            continue
+        distance = (size - num_minimal) / size
+        for index in compress(solution_indices, map(minimum.__eq__, column)):
+            if distance > distances[index]:
+                distances[index] = distance
+    return distances
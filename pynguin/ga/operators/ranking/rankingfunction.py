@@ -7,10 +7,13 @@
 """Provides implementations of a ranking function."""
 from __future__ import annotations
 
+import bisect
+import itertools
 import logging
+import operator
 from abc import ABCMeta, abstractmethod
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Generic, TypeVar
+from typing import TYPE_CHECKING, Collection, Generic, TypeVar
 
 from ordered_set import OrderedSet
 
@@ -66,7 +69,7 @@ class RankingFunction(Generic[C], metaclass=ABCMeta):
 
     @abstractmethod
     def compute_ranking_assignment(
-        self, solutions: list[C], uncovered_goals: OrderedSet[ff.FitnessFunction]
+        self, solutions: list[C], uncovered_goals: Collection[ff.FitnessFunction]
     ) -> RankedFronts:
         """Computes the ranking assignment for the given population of solutions.
 
@@ -85,6 +88,25 @@ class RankingFunction(Generic[C], metaclass=ABCMeta):
             The ranked fronts
         """
 
+    def compute_ranking_assignment_fast(
+        self, solutions: list[C], uncovered_goals: Collection[ff.FitnessFunction]
+    ) -> RankedFronts:
+        """Computes the ranking assignment using a faster algorithm, if available.
+
+        The resulting fronts are the same as computed by
+        `compute_ranking_assignment(list, Collection)`, which is also used by
+        default if there is no faster implementation.
+
+        Args:
+            solutions: The population to rank
+            uncovered_goals: The set of coverage goals to consider for the ranking
+                             assignment
+
+        Returns:
+            The ranked fronts
+        """
+        return self.compute_ranking_assignment(solutions, uncovered_goals)
+
 
 # pylint: disable=too-few-public-methods
 class RankBasedPreferenceSorting(RankingFunction, Generic[C]):
@@ -93,7 +115,7 @@ class RankBasedPreferenceSorting(RankingFunction, Generic[C]):
     _logger = logging.getLogger(__name__)
 
     def compute_ranking_assignment(
-        self, solutions: list[C], uncovered_goals: OrderedSet[ff.FitnessFunction]
+        self, solutions: list[C], uncovered_goals: Collection[ff.FitnessFunction]
     ) -> RankedFronts:
         if not solutions:
             self._logger.debug("Solution is empty")
@@ -145,9 +167,190 @@ class RankBasedPreferenceSorting(RankingFunction, Generic[C]):
 
         return RankedFronts(fronts)
 
+    def compute_ranking_assignment_fast(
+        self, solutions: list[C], uncovered_goals: Collection[ff.FitnessFunction]
+    ) -> RankedFronts:
+        """Computes the ranking assignment using an efficient non-dominated sorting.
+
+        The zero front is computed by preference sorting, as before.  The remaining
+        fronts are, however, not obtained by repeatedly extracting the non-dominated
+        solutions, which requires O(MN²) dominance comparisons per front, but
+        computed at once by `_non_dominated_sort(list, Collection)`.
+
+        Args:
+            solutions: The population to rank
+            uncovered_goals: The set of coverage goals to consider for the ranking
+                             assignment
+
+        Returns:
+            The ranked fronts
+        """
+        if not uncovered_goals or not solutions:
+            return self.compute_ranking_assignment(solutions, uncovered_goals)
+
+        zero_front: list[C] = self._get_zero_front(solutions, uncovered_goals)
+        fronts = [zero_front]
+        zero_front_ids = {id(element) for element in zero_front}
+        remaining = [
+            element for element in solutions if id(element) not in zero_front_ids
+        ]
+        population = config.configuration.search_algorithm.population
+
+        if len(zero_front) < population:
+            ranked_solutions = len(zero_front)
+            front_index = 1
+            for new_front in self._non_dominated_sort(remaining, uncovered_goals):
+                if ranked_solutions >= population:
+                    break
+                for element in new_front:
+                    element.rank = front_index
+                fronts.append(new_front)
+                ranked_solutions += len(new_front)
+                front_index += 1
+        else:
+            for element in remaining:
+                element.rank = 1
+            fronts.append(remaining)
+
+        return RankedFronts(fronts)
+
+    @staticmethod
+    def _non_dominated_sort(
+        solutions: list[C], goals: Collection[ff.FitnessFunction]
+    ) -> list[list[C]]:
+        """Sorts the solutions into non-dominated fronts.
+
+        Uses a specialised algorithm for one or two goals, which are common in late
+        phases of the search, when most goals are already covered.
+
+        Args:
+            solutions: The solutions to sort
+            goals: The goals to consider for the dominance test
+
+        Returns:
+            The non-dominated fronts, each in the order of the given solutions
+        """
+        if len(goals) == 1:
+            return RankBasedPreferenceSorting._single_objective_sort(solutions, goals)
+        if len(goals) == 2:
+            return RankBasedPreferenceSorting._bi_objective_sort(solutions, goals)
+        return RankBasedPreferenceSorting._fast_non_dominated_sort(solutions, goals)
+
+    @staticmethod
+    def _single_objective_sort(
+        solutions: list[C], goals: Collection[ff.FitnessFunction]
+    ) -> list[list[C]]:
+        """Sorts the solutions into fronts regarding a single goal.
+
+        For a single goal, a front consists of solutions with equal fitness values,
+        thus sorting by the fitness value is sufficient.
+
+        Args:
+            solutions: The solutions to sort
+            goals: The set containing the single goal to consider
+
+        Returns:
+            The non-dominated fronts, each in the order of the given solutions
+        """
+        (goal,) = goals
+        fitness = [solution.get_fitness_for(goal) for solution in solutions]
+        return [
+            [solutions[index] for index in front]
+            for _, front in itertools.groupby(
+                sorted(range(len(solutions)), key=fitness.__getitem__),
+                key=fitness.__getitem__,
+            )
+        ]
+
+    @staticmethod
+    def _bi_objective_sort(
+        solutions: list[C], goals: Collection[ff.FitnessFunction]
+    ) -> list[list[C]]:
+        """Sorts the solutions into non-dominated fronts regarding two goals.
+
+        After sorting the solutions lexicographically, the fitness values for the
+        second goal decrease within each front, and the last values of the fronts
+        increase, thus the front of a solution is found by a binary search, which
+        takes O(N log N) in total.
+
+        Args:
+            solutions: The solutions to sort
+            goals: The set containing the two goals to consider
+
+        Returns:
+            The non-dominated fronts, each in the order of the given solutions
+        """
+        goal_1, goal_2 = goals
+        fitness = [
+            (solution.get_fitness_for(goal_1), solution.get_fitness_for(goal_2))
+            for solution in solutions
+        ]
+        fronts: list[list[int]] = []
+        last_values: list[float] = []
+        previous: tuple[float, float] | None = None
+        rank = 0
+        for index in sorted(range(len(solutions)), key=fitness.__getitem__):
+            values = fitness[index]
+            # Equal solutions do not dominate each other, i.e., share the same front.
+            if values != previous:
+                rank = bisect.bisect_right(last_values, values[1])
+            if rank == len(fronts):
+                fronts.append([index])
+                last_values.append(values[1])
+            else:
+                fronts[rank].append(index)
+                last_values[rank] = values[1]
+            previous = values
+        return [[solutions[index] for index in sorted(front)] for front in fronts]
+
+    @staticmethod
+    def _fast_non_dominated_sort(
+        solutions: list[C], goals: Collection[ff.FitnessFunction]
+    ) -> list[list[C]]:
+        """Sorts the solutions into non-dominated fronts.
+
+        Implements the efficient non-dominated sort with sequential search (ENS-SS)
+        proposed by Zhang et al. in Xingyi Zhang, Ye Tian, Ran Cheng, and Yaochu Jin,
+        "An Efficient Approach to Nondominated Sorting for Evolutionary Multiobjective
+        Optimization", IEEE Transactions on Evolutionary Computation, vol. 19, no. 2,
+        2015, pp. 201–213.
+
+        After sorting the fitness vectors lexicographically, a solution can only be
+        dominated by solutions that precede it, thus it is sufficient to compare it
+        against the members of the fronts found so far.  Unlike divide-and-conquer
+        approaches, this does not degrade with the number of goals.
+
+        Args:
+            solutions: The solutions to sort
+            goals: The goals to consider for the dominance test
+
+        Returns:
+            The non-dominated fronts, each in the order of the given solutions
+        """
+        fitness = [
+            tuple(solution.get_fitness_for(goal) for goal in goals)
+            for solution in solutions
+        ]
+        fronts: list[list[int]] = []
+        for index in sorted(range(len(solutions)), key=fitness.__getitem__):
+            values = fitness[index]
+            for front in fronts:
+                # The members of a front are lexicographically smaller or equal,
+                # thus they dominate, iff they are smaller or equal in every goal.
+                if not any(
+                    fitness[member] != values
+                    and all(map(operator.le, fitness[member], values))
+                    for member in reversed(front)
+                ):
+                    front.append(index)
+                    break
+            else:
+                fronts.append([index])
+        return [[solutions[index] for index in sorted(front)] for front in fronts]
+
     @staticmethod
     def _get_zero_front(
-        solutions: list[C], uncovered_goals: OrderedSet[ff.FitnessFunction]
+        solutions: list[C], uncovered_goals: Collection[ff.FitnessFunction]
     ) -> list[C]:
         zero_front: OrderedSet[C] = OrderedSet()
         for goal in uncovered_goals:
@@ -11,7 +11,7 @@ import logging
 import sys
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Callable, Iterable
+from typing import Callable, Iterable, KeysView
 
 from ordered_set import OrderedSet
 
@@ -99,8 +99,12 @@ class CoverageArchive(Archive):
     def __init__(self, objectives: OrderedSet[ff.TestCaseFitnessFunction]) -> None:
         super().__init__()
         self._covered: dict[ff.TestCaseFitnessFunction, tcc.TestCaseChromosome] = {}
-        self._uncovered = OrderedSet(objectives)
+        # A dict is used as an ordered set, it is considerably faster to iterate.
+        self._uncovered: dict[ff.TestCaseFitnessFunction, None] = dict.fromkeys(
+            objectives
+        )
         self._objectives = OrderedSet(objectives)
+        self._epoch = 0
 
     def update(self, solutions: Iterable[tcc.TestCaseChromosome]) -> bool:
         """Updates this archive with the given set of solutions.
@@ -128,19 +132,30 @@ class CoverageArchive(Archive):
                     self._covered[objective] = solution
                     best_size = size
                     if objective in self._uncovered:
-                        self._uncovered.remove(objective)
+                        del self._uncovered[objective]
                         self._on_target_covered(objective)
+        if updated:
+            self._epoch += 1
         self._logger.debug("ArchiveCoverageGoals: %d", len(self._covered))
         return updated
 
     @property
-    def uncovered_goals(self) -> OrderedSet[ff.TestCaseFitnessFunction]:
+    def epoch(self) -> int:
+        """Provides a counter that is incremented whenever the solutions change.
+
+        Returns:
+            The number of changes to the solutions of this archive
+        """
+        return self._epoch
+
+    @property
+    def uncovered_goals(self) -> KeysView[ff.TestCaseFitnessFunction]:
         """Provides the set of goals that are yet to cover.
 
         Returns:
-            The uncovered goals
+            The uncovered goals, in the order in which they were added
         """
-        return self._uncovered
+        return self._uncovered.keys()
 
     @property
     def covered_goals(self) -> OrderedSet[ff.TestCaseFitnessFunction]:
@@ -166,7 +181,7 @@ class CoverageArchive(Archive):
             if goal not in self._objectives:
                 self._logger.debug("Adding goal: %s", goal)
                 self._objectives.add(goal)
-                self._uncovered.add(goal)
+                self._uncovered[goal] = None
 
     @property
     def solutions(self) -> OrderedSet[tcc.TestCaseChromosome]:
@@ -175,8 +190,9 @@ class CoverageArchive(Archive):
 
     def reset(self) -> None:
         """Resets the archive."""
-        self._uncovered.update(self._objectives)
+        self._uncovered.update(dict.fromkeys(self._objectives))
         self._covered.clear()
+        self._epoch += 1
 
     def _all_covered(self) -> bool:
         return all(
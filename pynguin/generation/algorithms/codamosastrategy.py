@@ -7,11 +7,11 @@
 """Provides the CodaMOSA test-generation strategy."""
 from __future__ import annotations
 
+import itertools
 import logging
 import os
-from typing import TYPE_CHECKING, List, Set
-
-from ordered_set import OrderedSet
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Iterable, List, Set
 
 import pynguin.configuration as config
 import pynguin.ga.computations as ff
@@ -20,7 +20,8 @@ import pynguin.testcase.testcase as tc
 import pynguin.utils.statistics.statistics as stat
 from pynguin.analyses.seeding import languagemodelseeding
 from pynguin.ga.operators.ranking.crowdingdistance import (
-    fast_epsilon_dominance_assignment,
+    fast_epsilon_dominance_assignment_for_fronts,
+    select_most_distant,
 )
 from pynguin.generation.algorithms.abstractmosastrategy import AbstractMOSATestStrategy
 from pynguin.generation.export.pytestexporter import PyTestExporter
@@ -42,6 +43,8 @@ logger = logging.getLogger(__name__)
 
 if TYPE_CHECKING:
     import pynguin.ga.testsuitechromosome as tsc
+    from pynguin.generation.algorithms.archive import CoverageArchive
+    from pynguin.testcase.execution import ExecutionResult
 
 
 # pylint: disable=too-many-instance-attributes
@@ -58,6 +61,14 @@ class CodaMOSATestStrategy(AbstractMOSATestStrategy):
         self._num_added_tests_needed_uninterp = 0
         self._num_added_tests_needed_calls = 0
         self._plateau_len = config.configuration.codamosa.max_plateau_len
+        # Execution results of recently evaluated test cases, in LRU order.
+        self._execution_cache: OrderedDict[tc.TestCase, ExecutionResult] = OrderedDict()
+        self._execution_cache_size = (
+            4 * config.configuration.search_algorithm.population
+        )
+        # The suite of the archive's solutions, and the archive state it was built for
+        self._archive_suite: tsc.TestSuiteChromosome | None = None
+        self._archive_suite_key: tuple[CoverageArchive, int] | None = None
 
     def _log_num_codamosa_tests_added(self):
         scs = [
@@ -152,6 +163,67 @@ class CodaMOSATestStrategy(AbstractMOSATestStrategy):
             RuntimeVariable.LLMStageSavedMutants, self._num_mutant_codamosa_tests_added
         )
 
+    def _lookup_cached_execution(self, chromosome: tcc.TestCaseChromosome) -> bool:
+        """Reuses the execution result of an equal, recently executed test case.
+
+        On a hit, the changed chromosome gets the cached execution result, such that
+        its fitness values are computed without executing the test case again.
+
+        Args:
+            chromosome: The changed chromosome to look up
+
+        Returns:
+            Whether a cached execution result was found
+        """
+        test_case = chromosome.test_case
+        result = self._execution_cache.get(test_case)
+        if result is None:
+            return False
+        self._execution_cache.move_to_end(test_case)
+        chromosome.invalidate_cache()
+        chromosome.set_last_execution_result(result)
+        chromosome.set_changed(False)
+        return True
+
+    def _store_execution(self, chromosome: tcc.TestCaseChromosome) -> None:
+        """Caches the execution result of an executed chromosome.
+
+        The least recently used entry is evicted once the cache is full.
+
+        Args:
+            chromosome: The executed chromosome
+        """
+        result = chromosome.get_last_execution_result()
+        assert result is not None, "Chromosome was not executed"
+        test_case = chromosome.test_case
+        if test_case in self._execution_cache:
+            self._execution_cache.move_to_end(test_case)
+            return
+        # Store a clone, as the test case of the chromosome may still be mutated.
+        self._execution_cache[test_case.clone()] = result
+        if len(self._execution_cache) > self._execution_cache_size:
+            self._execution_cache.popitem(last=False)
+
+    def _execute_changed(self, chromosomes: Iterable[tcc.TestCaseChromosome]) -> None:
+        """Executes the changed chromosomes in one pass before they are ranked.
+
+        Only chromosomes that miss the execution cache are executed.  Their results
+        are cached right away, thus later chromosomes of the same batch with an equal
+        test case reuse them instead of being executed again.
+
+        Args:
+            chromosomes: The chromosomes to execute
+        """
+        for chromosome in chromosomes:
+            if not chromosome.has_changed() or self._lookup_cached_execution(
+                chromosome
+            ):
+                continue
+            # The cached fitness values stem from before the change
+            chromosome.invalidate_cache()
+            ff.run_test_case_chromosome(self._executor, chromosome)
+            self._store_execution(chromosome)
+
     def generate_tests(self) -> tsc.TestSuiteChromosome:
         self.before_search_start()
         self._number_of_goals = len(self._test_case_fitness_functions)
@@ -163,25 +235,24 @@ class CodaMOSATestStrategy(AbstractMOSATestStrategy):
         self._archive.update(self._population)
 
         # Calculate dominance ranks and crowding distance
-        fronts = self._ranking_function.compute_ranking_assignment(
-            self._population, self._archive.uncovered_goals  # type: ignore
+        uncovered_goals = tuple(self._archive.uncovered_goals)
+        fronts = self._ranking_function.compute_ranking_assignment_fast(
+            self._population, uncovered_goals
         )
-        for i in range(fronts.get_number_of_sub_fronts()):
-            fast_epsilon_dominance_assignment(
-                fronts.get_sub_front(i), self._archive.uncovered_goals  # type: ignore
-            )
-
-        self.before_first_search_iteration(
-            self.create_test_suite(self._archive.solutions)
+        fast_epsilon_dominance_assignment_for_fronts(
+            (fronts.get_sub_front(i) for i in range(fronts.get_number_of_sub_fronts())),
+            uncovered_goals,
         )
 
+        self.before_first_search_iteration(self._create_archive_suite())
+
         last_num_covered_goals = len(self._archive.covered_goals)
         its_without_update = 0
         while (
             self.resources_left()
-            and self._number_of_goals - len(self._archive.covered_goals) != 0
+            and (num_covered_goals := len(self._archive.covered_goals))
+            != self._number_of_goals
         ):
-            num_covered_goals = len(self._archive.covered_goals)
             if num_covered_goals == last_num_covered_goals:
                 its_without_update += 1
             else:
@@ -189,17 +260,29 @@ class CodaMOSATestStrategy(AbstractMOSATestStrategy):
             last_num_covered_goals = num_covered_goals
             if its_without_update > self._plateau_len:
                 its_without_update = 0
-                self.evolve_targeted(self.create_test_suite(self._archive.solutions))
+                self.evolve_targeted(self._create_archive_suite())
             else:
                 self.evolve()
-            self.after_search_iteration(self.create_test_suite(self._archive.solutions))
+            self.after_search_iteration(self._create_archive_suite())
 
         self.after_search_finish()
-        return self.create_test_suite(
-            self._archive.solutions
-            if len(self._archive.solutions) > 0
-            else self._get_best_individuals()
-        )
+        if len(self._archive.covered_goals) > 0:
+            return self._create_archive_suite()
+        return self.create_test_suite(self._get_best_individuals())
+
+    def _create_archive_suite(self) -> tsc.TestSuiteChromosome:
+        """Provides a test suite of the archive's solutions.
+
+        The suite is only built again once the solutions of the archive changed.
+
+        Returns:
+            A test suite of the archive's solutions
+        """
+        key = (self._archive, self._archive.epoch)
+        if self._archive_suite is None or self._archive_suite_key != key:
+            self._archive_suite = self.create_test_suite(self._archive.solutions)
+            self._archive_suite_key = key
+        return self._archive_suite
 
     def evolve_targeted(self, test_suite: tsc.TestSuiteChromosome):
         """Runs an evolution step that targets uncovered functions.
@@ -228,33 +311,10 @@ class CodaMOSATestStrategy(AbstractMOSATestStrategy):
             tcc.TestCaseChromosome(test_case, self.test_factory)
             for test_case in test_cases
         ]
-        new_offspring: List[tcc.TestCaseChromosome] = []
-        while (
-            len(new_offspring) < config.configuration.search_algorithm.population
-            and self.resources_left()
-        ):
-            offspring_1 = randomness.choice(test_case_chromosomes).clone()
-
-            offspring_2 = randomness.choice(test_case_chromosomes).clone()
-
-            if (
-                randomness.next_float()
-                <= config.configuration.search_algorithm.crossover_rate
-            ):
-                try:
-                    self._crossover_function.cross_over(offspring_1, offspring_2)
-                except ConstructionFailedException:
-                    self._logger.debug("CrossOver failed.")
-                    continue
-
-            self._mutate(offspring_1)
-            if offspring_1.has_changed() and offspring_1.size() > 0:
-                new_offspring.append(offspring_1)
-            self._mutate(offspring_2)
-            if offspring_2.has_changed() and offspring_2.size() > 0:
-                new_offspring.append(offspring_2)
-
-        self.evolve_common(test_case_chromosomes + new_offspring)
+        self.evolve_common(
+            test_case_chromosomes
+            + self._breed_targeted_offspring(test_case_chromosomes)
+        )
 
         added_tests = False
         for chrom in self._population:
@@ -270,12 +330,75 @@ class CodaMOSATestStrategy(AbstractMOSATestStrategy):
             # length so we don't waste too much time querying codex.
             self._plateau_len = 2 * self._plateau_len
 
+    def _breed_targeted_offspring(
+        self, test_case_chromosomes: list[tcc.TestCaseChromosome]
+    ) -> list[tcc.TestCaseChromosome]:
+        """Breeds offspring from the generated test cases by crossover and mutation.
+
+        Args:
+            test_case_chromosomes: the chromosomes of the generated test cases
+
+        Returns:
+            The distinct offspring that were bred
+        """
+        new_offspring: List[tcc.TestCaseChromosome] = []
+        # Duplicated test cases would only take up a slot in the ranking, thus we
+        # still count them as generated, but only keep the unique ones.
+        seen_test_cases: Set[tc.TestCase] = {
+            chrom.test_case for chrom in test_case_chromosomes
+        }
+        # The configuration does not change during the loop, thus look it up once
+        population = config.configuration.search_algorithm.population
+        crossover_rate = config.configuration.search_algorithm.crossover_rate
+        add_offspring = new_offspring.append
+        # The parents are drawn in batches, two per iteration, instead of one by one
+        parents: list[tcc.TestCaseChromosome] = []
+        parent_index = 0
+        num_offspring = 0
+        while num_offspring < population and self.resources_left():
+            if parent_index == len(parents):
+                parents = randomness.choices(test_case_chromosomes, k=2 * population)
+                parent_index = 0
+            offspring_1 = parents[parent_index].clone()
+
+            offspring_2 = parents[parent_index + 1].clone()
+            parent_index += 2
+
+            if randomness.next_float() <= crossover_rate:
+                try:
+                    self._crossover_function.cross_over(offspring_1, offspring_2)
+                except ConstructionFailedException:
+                    self._logger.debug("CrossOver failed.")
+                    continue
+
+            for offspring in (offspring_1, offspring_2):
+                if not self._mutate_offspring(offspring):
+                    continue
+                num_offspring += 1
+                if offspring.test_case not in seen_test_cases:
+                    seen_test_cases.add(offspring.test_case)
+                    add_offspring(offspring)
+
+        return new_offspring
+
+    def _mutate_offspring(self, offspring: tcc.TestCaseChromosome) -> bool:
+        """Mutates an offspring and checks whether it is worth keeping.
+
+        Args:
+            offspring: The offspring to mutate
+
+        Returns:
+            Whether the offspring changed and still contains statements
+        """
+        self._mutate(offspring)
+        return offspring.has_changed() and offspring.size() > 0
+
     def evolve(self) -> None:
         """Runs one evolution step."""
         offspring_population = self._breed_next_generation()
         self.evolve_common(offspring_population)
 
-    def evolve_common(self, offspring_population) -> None:
+    def evolve_common(self, offspring_population: list[tcc.TestCaseChromosome]) -> None:
         """The core logic to save offspring if they are interesting.
 
         Args:
@@ -283,33 +406,33 @@ class CodaMOSATestStrategy(AbstractMOSATestStrategy):
         """
 
         # Create union of parents and offspring
-        union: list[tcc.TestCaseChromosome] = []
-        union.extend(self._population)
-        union.extend(offspring_population)
+        union: list[tcc.TestCaseChromosome] = self._population + offspring_population
+
+        # Snapshot the uncovered goals once for the whole generation
+        uncovered_goals: tuple[ff.FitnessFunction, ...] = tuple(
+            self._archive.uncovered_goals
+        )
 
-        uncovered_goals: OrderedSet[
-            ff.FitnessFunction
-        ] = self._archive.uncovered_goals  # type: ignore
+        # Execute the offspring, unless they equal a recently executed test case
+        self._execute_changed(offspring_population)
 
         # Ranking the union
         self._logger.debug("Union Size = %d", len(union))
         # Ranking the union using the best rank algorithm
-        fronts = self._ranking_function.compute_ranking_assignment(
+        fronts = self._ranking_function.compute_ranking_assignment_fast(
             union, uncovered_goals
         )
 
-        remain = len(self._population)
-        index = 0
-        self._population.clear()
+        remain: int = len(self._population)
+        index: int = 0
 
         # Obtain the next front
-        front = fronts.get_sub_front(index)
+        front: list[tcc.TestCaseChromosome] = fronts.get_sub_front(index)
 
+        selected_fronts: list[list[tcc.TestCaseChromosome]] = []
         while remain > 0 and remain >= len(front) != 0:
-            # Assign crowding distance to individuals
-            fast_epsilon_dominance_assignment(front, uncovered_goals)
             # Add the individuals of this front
-            self._population.extend(front)
+            selected_fronts.append(front)
             # Decrement remain
             remain -= len(front)
             # Obtain the next front
@@ -317,11 +440,21 @@ class CodaMOSATestStrategy(AbstractMOSATestStrategy):
             if remain > 0:
                 front = fronts.get_sub_front(index)
 
-        # Remain is less than len(front[index]), insert only the best one
-        if remain > 0 and len(front) != 0:
-            fast_epsilon_dominance_assignment(front, uncovered_goals)
-            front.sort(key=lambda t: t.distance, reverse=True)
-            for k in range(remain):
-                self._population.append(front[k])
+        # Remain is less than len(front[index]), this front is only taken partially
+        partial_front: bool = remain > 0 and len(front) != 0
+        if partial_front:
+            selected_fronts.append(front)
+
+        # Assign crowding distance to the individuals of all selected fronts at once
+        distances = fast_epsilon_dominance_assignment_for_fronts(
+            selected_fronts, uncovered_goals
+        )
+
+        # Insert only the best ones of the partial front
+        if partial_front:
+            selected_fronts[-1] = select_most_distant(front, distances[-1], remain)
+
+        # Replace the population in place by the selected fronts
+        self._population[:] = itertools.chain.from_iterable(selected_fronts)
 
         self._archive.update(self._population)
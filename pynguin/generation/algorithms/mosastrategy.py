@@ -8,9 +8,7 @@
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING
-
-from ordered_set import OrderedSet
+from typing import TYPE_CHECKING, KeysView
 
 import pynguin.configuration as config
 import pynguin.ga.computations as ff
@@ -44,11 +42,11 @@ class MOSATestStrategy(AbstractMOSATestStrategy):
 
         # Calculate dominance ranks and crowding distance
         fronts = self._ranking_function.compute_ranking_assignment(
-            self._population, self._archive.uncovered_goals  # type: ignore
+            self._population, self._archive.uncovered_goals
         )
         for i in range(fronts.get_number_of_sub_fronts()):
             fast_epsilon_dominance_assignment(
-                fronts.get_sub_front(i), self._archive.uncovered_goals  # type: ignore
+                fronts.get_sub_front(i), self._archive.uncovered_goals
             )
 
         self.before_first_search_iteration(
@@ -91,9 +89,7 @@ class MOSATestStrategy(AbstractMOSATestStrategy):
         union.extend(self._population)
         union.extend(offspring_population)
 
-        uncovered_goals: OrderedSet[
-            ff.FitnessFunction
-        ] = self._archive.uncovered_goals  # type: ignore
+        uncovered_goals: KeysView[ff.FitnessFunction] = self._archive.uncovered_goals
 
         # Ranking the union
         self._logger.debug("Union Size = %d", len(union))
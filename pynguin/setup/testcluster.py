@@ -21,6 +21,9 @@ from pynguin.instrumentation.instrumentation import CODE_OBJECT_ID_KEY
 from pynguin.utils import randomness, type_utils
 from pynguin.utils.exceptions import ConstructionFailedException
 from pynguin.utils.generic.genericaccessibleobject import (
+    KIND_CONSTRUCTOR,
+    KIND_FUNCTION,
+    KIND_METHOD,
     GenericAccessibleObject,
     GenericCallableAccessibleObject,
     GenericConstructor,
@@ -336,7 +339,7 @@ class ExpandableTestCluster(FullTestCluster):
         Args:
             func: function to add
         """
-        if func.is_constructor():
+        if func.KIND == KIND_CONSTRUCTOR:
             generated_type = func.generated_type()
             assert generated_type is not None
             func_name = generated_type.__name__
@@ -345,7 +348,7 @@ class ExpandableTestCluster(FullTestCluster):
             if module_name in self._module_aliases:
                 qual_module_name = self._module_aliases[module_name]
                 func_names.append(qual_module_name + "." + func_name)
-        elif func.is_function():
+        elif func.KIND == KIND_FUNCTION:
             func_name = func.function_name  # type: ignore
             callable_ = func.callable  # type: ignore
             module_name = callable_.__module__
@@ -353,7 +356,7 @@ class ExpandableTestCluster(FullTestCluster):
             if module_name in self._module_aliases:
                 qual_module_name = self._module_aliases[module_name]
                 func_names.append(qual_module_name + "." + func_name)
-        elif func.is_method():
+        elif func.KIND == KIND_METHOD:
             assert func.owner is not None
             func_name = func.method_name  # type: ignore
             owner_name = func.owner.__name__
@@ -385,7 +388,7 @@ class ExpandableTestCluster(FullTestCluster):
             self.add_generator(func)
 
             # Add it as a modifier if it is a method
-            if func.is_method():
+            if func.KIND == KIND_METHOD:
                 modified_type = func.owner
                 assert modified_type is not None
                 self.add_modifier(modified_type, func)
@@ -413,7 +416,7 @@ class ExpandableTestCluster(FullTestCluster):
                             self.promote_object(constructor)
 
             # Also retrieve all the methods for a constructor
-            if func.is_constructor():
+            if func.KIND == KIND_CONSTRUCTOR:
                 type_under_test = func.owner
                 assert type_under_test is not None
                 methods = [
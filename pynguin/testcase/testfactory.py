@@ -20,6 +20,11 @@ from pynguin.analyses.codedeserializer import deserialize_code_to_testcases
 from pynguin.languagemodels import model
 from pynguin.utils import randomness
 from pynguin.utils.exceptions import ConstructionFailedException
+from pynguin.utils.generic.genericaccessibleobject import (
+    KIND_CONSTRUCTOR,
+    KIND_FUNCTION,
+    KIND_METHOD,
+)
 from pynguin.utils.type_utils import (
     is_assignable_to,
     is_collection_type,
@@ -554,7 +559,7 @@ class TestFactory:
         """
         previous_length = test_case.size()
         try:
-            if accessible.is_method():
+            if accessible.KIND == KIND_METHOD:
                 method = cast(gao.GenericMethod, accessible)
                 self.add_method(test_case, method, position, callee=callee)
                 return True
@@ -790,7 +795,7 @@ class TestFactory:
         position = statement.ret_val.get_statement_position()
         return_value = statement.ret_val
         replacement: stmt.Statement | None = None
-        if call.is_method():
+        if call.KIND == KIND_METHOD:
             method = cast(gao.GenericMethod, call)
             assert method.owner
             callee = self._get_random_non_none_object(test_case, method.owner, position)
@@ -798,13 +803,13 @@ class TestFactory:
                 test_case, method.inferred_signature, position
             )
             replacement = stmt.MethodStatement(test_case, method, callee, parameters)
-        elif call.is_constructor():
+        elif call.KIND == KIND_CONSTRUCTOR:
             constructor = cast(gao.GenericConstructor, call)
             parameters = self._get_reuse_parameters(
                 test_case, constructor.inferred_signature, position
             )
             replacement = stmt.ConstructorStatement(test_case, constructor, parameters)
-        elif call.is_function():
+        elif call.KIND == KIND_FUNCTION:
             funktion = cast(gao.GenericFunction, call)
             parameters = self._get_reuse_parameters(
                 test_case, funktion.inferred_signature, position
@@ -888,7 +893,7 @@ class TestFactory:
 
     @staticmethod
     def _dependencies_satisfied(
-        dependencies: set[type], objects: list[vr.VariableReference]
+        dependencies: frozenset[type], objects: list[vr.VariableReference]
     ) -> bool:
         """Determine if the set of objects is sufficient to satisfy the set of
         dependencies.
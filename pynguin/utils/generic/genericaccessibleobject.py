@@ -16,12 +16,30 @@ import typing
 from typing import Callable, cast
 
 if typing.TYPE_CHECKING:
+    from inspect import Signature
+
     from pynguin.typeinference.strategy import InferredSignature
 
 
+# The kinds of accessible objects, see GenericAccessibleObject.KIND
+KIND_UNKNOWN = 0
+KIND_ENUM = 1
+KIND_CONSTRUCTOR = 2
+KIND_METHOD = 3
+KIND_FUNCTION = 4
+KIND_FIELD = 5
+KIND_STATIC_FIELD = 6
+KIND_STATIC_MODULE_FIELD = 7
+
+
 class GenericAccessibleObject(metaclass=abc.ABCMeta):
     """Abstract base class for something that can be accessed."""
 
+    __slots__ = ("_owner",)
+
+    # The kind of this accessible object, fixed per subclass
+    KIND: typing.ClassVar[int] = KIND_UNKNOWN
+
     def __init__(self, owner: type | None):
         self._owner = owner
 
@@ -106,7 +124,7 @@ class GenericAccessibleObject(metaclass=abc.ABCMeta):
         return 0
 
     @abc.abstractmethod
-    def get_dependencies(self) -> set[type]:
+    def get_dependencies(self) -> frozenset[type]:
         """A set of types that are required to use this accessible.
 
         Returns:
@@ -117,6 +135,10 @@ class GenericAccessibleObject(metaclass=abc.ABCMeta):
 class GenericEnum(GenericAccessibleObject):
     """Models an enum."""
 
+    __slots__ = ("_names",)
+
+    KIND = KIND_ENUM
+
     def __init__(self, owner: type[enum.Enum]):
         super().__init__(owner)
         self._names = list(map(lambda e: e.name, cast(list[enum.Enum], list(owner))))
@@ -135,8 +157,8 @@ class GenericEnum(GenericAccessibleObject):
     def is_enum(self) -> bool:
         return True
 
-    def get_dependencies(self) -> set[type]:
-        return set()  # pylint:disable=no-self-use
+    def get_dependencies(self) -> frozenset[type]:
+        return frozenset()  # pylint:disable=no-self-use
 
     def __eq__(self, other):
         if self is other:
@@ -157,6 +179,13 @@ class GenericCallableAccessibleObject(
 ):  # pylint: disable=W0223
     """Abstract base class for something that can be called."""
 
+    __slots__ = (
+        "_callable",
+        "_inferred_signature",
+        "_dependencies",
+        "_dependencies_signature",
+    )
+
     def __init__(
         self,
         owner: type | None,
@@ -166,6 +195,10 @@ class GenericCallableAccessibleObject(
         super().__init__(owner)
         self._callable = callable_
         self._inferred_signature = inferred_signature
+        # Computed on access, updating the inferred signature replaces its signature
+        # object, which invalidates the cached dependencies.
+        self._dependencies: frozenset[type] | None = None
+        self._dependencies_signature: Signature | None = None
 
     def generated_type(self) -> type | None:
         return self._inferred_signature.return_type
@@ -191,21 +224,33 @@ class GenericCallableAccessibleObject(
     def get_num_parameters(self) -> int:
         return len(self.inferred_signature.parameters)
 
-    def get_dependencies(self) -> set[type]:
-        return {
+    def get_dependencies(self) -> frozenset[type]:
+        signature = self._inferred_signature.signature
+        if self._dependencies is None or self._dependencies_signature is not signature:
+            self._dependencies = self._compute_dependencies()
+            self._dependencies_signature = signature
+        return self._dependencies
+
+    def _compute_dependencies(self) -> frozenset[type]:
+        return frozenset(
             value
             for value in self.inferred_signature.parameters.values()
             if value is not None
-        }
+        )
 
 
 class GenericConstructor(GenericCallableAccessibleObject):
     """A constructor."""
 
+    __slots__ = ("_hash",)
+
+    KIND = KIND_CONSTRUCTOR
+
     def __init__(self, owner: type, inferred_signature: InferredSignature) -> None:
         # super().__init__(owner, owner.__init__, inferred_signature)  # type: ignore
         super().__init__(owner, getattr(owner, "__init__"), inferred_signature)
         assert owner
+        self._hash = hash(owner)
 
     def generated_type(self) -> type | None:
         return self.owner
@@ -221,7 +266,7 @@ class GenericConstructor(GenericCallableAccessibleObject):
         return self._owner == other._owner
 
     def __hash__(self):
-        return hash(self._owner)
+        return self._hash
 
     def __repr__(self):
         return f"{self.__class__.__name__}({self.owner}, {self.inferred_signature})"
@@ -230,6 +275,10 @@ class GenericConstructor(GenericCallableAccessibleObject):
 class GenericMethod(GenericCallableAccessibleObject):
     """A method."""
 
+    __slots__ = ("_method_name", "_hash")
+
+    KIND = KIND_METHOD
+
     def __init__(
         self,
         owner: type,
@@ -240,6 +289,7 @@ class GenericMethod(GenericCallableAccessibleObject):
         super().__init__(owner, method, inferred_signature)
         assert owner
         self._method_name = method_name
+        self._hash = 17 * hash(method) + hash(owner)
 
     @property
     def method_name(self):
@@ -253,11 +303,9 @@ class GenericMethod(GenericCallableAccessibleObject):
     def is_method(self) -> bool:
         return True
 
-    def get_dependencies(self) -> set[type]:
+    def _compute_dependencies(self) -> frozenset[type]:
         assert self.owner, "Method must have an owner"
-        dependencies = super().get_dependencies()
-        dependencies.add(self.owner)
-        return dependencies
+        return super()._compute_dependencies() | {self.owner}
 
     def __eq__(self, other):
         if self is other:
@@ -269,7 +317,7 @@ class GenericMethod(GenericCallableAccessibleObject):
         return self._callable == other._callable
 
     def __hash__(self):
-        return 17 * hash(self._callable) + hash(self.owner)
+        return self._hash
 
     def __repr__(self):
         return (
@@ -281,6 +329,10 @@ class GenericMethod(GenericCallableAccessibleObject):
 class GenericFunction(GenericCallableAccessibleObject):
     """A function, which does not belong to any class."""
 
+    __slots__ = ("_function_name", "_hash")
+
+    KIND = KIND_FUNCTION
+
     def __init__(
         self,
         function: Callable,
@@ -289,6 +341,7 @@ class GenericFunction(GenericCallableAccessibleObject):
     ) -> None:
         self._function_name = function_name
         super().__init__(None, function, inferred_signature)
+        self._hash = hash(function)
 
     def is_function(self) -> bool:
         return True
@@ -310,7 +363,7 @@ class GenericFunction(GenericCallableAccessibleObject):
         return self._callable == other._callable
 
     def __hash__(self):
-        return hash(self._callable)
+        return self._hash
 
     def __repr__(self):
         return (
@@ -322,6 +375,8 @@ class GenericFunction(GenericCallableAccessibleObject):
 class GenericAbstractField(GenericAccessibleObject, metaclass=abc.ABCMeta):
     """Abstract superclass for fields."""
 
+    __slots__ = ("_field", "_field_type")
+
     def __init__(self, owner: type | None, field: str, field_type: type | None) -> None:
         super().__init__(owner)
         self._field = field
@@ -346,13 +401,18 @@ class GenericAbstractField(GenericAccessibleObject, metaclass=abc.ABCMeta):
 class GenericField(GenericAbstractField):
     """A field of an object."""
 
+    __slots__ = ("_dependencies", "_hash")
+
+    KIND = KIND_FIELD
+
     def __init__(self, owner: type, field: str, field_type: type | None):
         super().__init__(owner, field, field_type)
         assert owner, "Field must have an owner"
+        self._dependencies = frozenset((owner,))
+        self._hash = 31 + 17 * hash(owner) + 17 * hash(field)
 
-    def get_dependencies(self) -> set[type]:
-        assert self._owner, "Field must have an owner"
-        return {self._owner}
+    def get_dependencies(self) -> frozenset[type]:
+        return self._dependencies
 
     def __eq__(self, other):
         if self is other:
@@ -362,7 +422,7 @@ class GenericField(GenericAbstractField):
         return self._owner == other._owner and self._field == other._field
 
     def __hash__(self):
-        return 31 + 17 * hash(self._owner) + 17 * hash(self._field)
+        return self._hash
 
     def __repr__(self):
         return (
@@ -374,6 +434,10 @@ class GenericField(GenericAbstractField):
 class GenericStaticField(GenericAbstractField):
     """Static field of a class."""
 
+    __slots__ = ()
+
+    KIND = KIND_STATIC_FIELD
+
     def __init__(self, owner: type, field: str, field_type: type | None):
         super().__init__(owner, field, field_type)
         assert owner, "Field must have an owner"
@@ -381,8 +445,8 @@ class GenericStaticField(GenericAbstractField):
     def is_static(self) -> bool:
         return True
 
-    def get_dependencies(self) -> set[type]:
-        return set()
+    def get_dependencies(self) -> frozenset[type]:
+        return frozenset()
 
     def __eq__(self, other):
         if self is other:
@@ -406,6 +470,10 @@ class GenericStaticModuleField(GenericAbstractField):
 
     # TODO(fk) combine with regular static field?
 
+    __slots__ = ("_module",)
+
+    KIND = KIND_STATIC_MODULE_FIELD
+
     def __init__(self, module: str, field: str, field_type: type | None):
         super().__init__(None, field, field_type)
         self._module = module
@@ -413,8 +481,8 @@ class GenericStaticModuleField(GenericAbstractField):
     def is_static(self) -> bool:
         return True
 
-    def get_dependencies(self) -> set[type]:
-        return set()
+    def get_dependencies(self) -> frozenset[type]:
+        return frozenset()
 
     @property
     def module(self) -> str:
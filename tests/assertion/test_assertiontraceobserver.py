@@ -8,6 +8,7 @@ from unittest import mock
 from unittest.mock import MagicMock
 
 import pynguin.assertion.assertiontraceobserver as ato
+import pynguin.utils.generic.genericaccessibleobject as gao
 from pynguin.testcase.execution import ExecutionContext
 from pynguin.testcase.statement import Statement
 
@@ -34,6 +35,18 @@ def test_clear():
         trace_mock.clear.assert_called_once()
 
 
+def test_get_field_shared_until_clear():
+    observer = FooObserver()
+    field = observer._get_field(gao.GenericField, complex, "real", float)
+    assert field is observer._get_field(gao.GenericField, complex, "real", float)
+    assert field is not observer._get_field(gao.GenericField, complex, "imag", float)
+    assert field is not observer._get_field(
+        gao.GenericStaticField, complex, "real", float
+    )
+    observer.clear()
+    assert field is not observer._get_field(gao.GenericField, complex, "real", float)
+
+
 def test_clone():
     observer = FooObserver()
     with mock.patch.object(observer, "_trace") as trace_mock:
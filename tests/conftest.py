@@ -14,6 +14,7 @@ import pytest
 from bytecode import Bytecode, Instr, Label
 
 import pynguin.configuration as config
+import pynguin.ga.chromosome as chrom
 import pynguin.testcase.defaulttestcase as dtc
 import pynguin.testcase.statement as stmt
 import pynguin.testcase.testcase as tc
@@ -151,6 +152,17 @@ def field_mock() -> GenericField:
     return GenericField(owner=SomeType, field="y", field_type=float)
 
 
+@pytest.fixture()
+def chromosome_with_fitness() -> Callable[..., MagicMock]:
+    def create(goals, values, spec=chrom.Chromosome) -> MagicMock:
+        chromosome = MagicMock(spec)
+        chromosome.get_fitness_for.side_effect = dict(zip(goals, values)).__getitem__
+        chromosome.length.return_value = 1
+        return chromosome
+
+    return create
+
+
 @pytest.fixture
 def short_test_case(constructor_mock):
     test_case = dtc.DefaultTestCase()
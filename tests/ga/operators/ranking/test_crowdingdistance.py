@@ -0,0 +1,62 @@
+#  This file is part of Pynguin.
+#
+#  SPDX-FileCopyrightText: 2019–2022 Pynguin Contributors
+#
+#  SPDX-License-Identifier: LGPL-3.0-or-later
+#
+from unittest.mock import MagicMock
+
+import pytest
+
+import pynguin.ga.computations as ff
+from pynguin.ga.operators.ranking.crowdingdistance import (
+    fast_epsilon_dominance_assignment,
+    fast_epsilon_dominance_assignment_for_fronts,
+    select_most_distant,
+)
+
+
+@pytest.fixture
+def goals():
+    return [MagicMock(ff.FitnessFunction), MagicMock(ff.FitnessFunction)]
+
+
+def test_fast_epsilon_dominance_assignment(goals, chromosome_with_fitness):
+    first = chromosome_with_fitness(goals, [0.0, 1.0])
+    second = chromosome_with_fitness(goals, [1.0, 1.0])
+    third = chromosome_with_fitness(goals, [1.0, 0.5])
+    distances = fast_epsilon_dominance_assignment([first, second, third], goals)
+    assert distances == [first.distance, second.distance, third.distance]
+    assert first.distance == pytest.approx(2 / 3)
+    assert second.distance == 0.0
+    assert third.distance == pytest.approx(2 / 3)
+
+
+def test_fast_epsilon_dominance_assignment_equal_values(goals, chromosome_with_fitness):
+    first = chromosome_with_fitness(goals, [0.5, 0.0])
+    second = chromosome_with_fitness(goals, [0.5, 0.0])
+    fast_epsilon_dominance_assignment([first, second], goals)
+    assert first.distance == 0.0
+    assert second.distance == 0.0
+
+
+def test_fast_epsilon_dominance_assignment_empty_front(goals):
+    assert fast_epsilon_dominance_assignment([], goals) == []
+
+
+def test_fast_epsilon_dominance_assignment_for_fronts(goals, chromosome_with_fitness):
+    first = chromosome_with_fitness(goals, [0.0, 1.0])
+    second = chromosome_with_fitness(goals, [1.0, 1.0])
+    third = chromosome_with_fitness(goals, [1.0, 0.0])
+    distances = fast_epsilon_dominance_assignment_for_fronts(
+        [[first, second], [third]], iter(goals)
+    )
+    assert distances == [[first.distance, second.distance], [third.distance]]
+    assert first.distance == pytest.approx(0.5)
+    assert second.distance == 0.0
+    assert third.distance == 0.0
+
+
+def test_select_most_distant():
+    front = ["a", "b", "c", "d"]
+    assert select_most_distant(front, [0.5, 1.0, 0.5, 0.0], 3) == ["b", "a", "c"]
@@ -4,12 +4,16 @@
 #
 #  SPDX-License-Identifier: LGPL-3.0-or-later
 #
+import random
 from unittest.mock import MagicMock
 
 import pytest
+from ordered_set import OrderedSet
 
 import pynguin.configuration as config
 import pynguin.ga.chromosome as chrom
+import pynguin.ga.computations as ff
+from pynguin.ga.comparators.dominancecomparator import DominanceComparator
 from pynguin.ga.operators.ranking.rankingfunction import (
     RankBasedPreferenceSorting,
     RankedFronts,
@@ -72,3 +76,41 @@ def test_compute_ranking_assignment(ranking_function):
 
     result = ranking_function.compute_ranking_assignment(solutions, set())
     assert result == expected
+
+
+@pytest.mark.parametrize("num_goals", [1, 2, 4])
+def test_non_dominated_sort_matches_iterative_sort(num_goals, chromosome_with_fitness):
+    rng = random.Random(42)
+    goals = OrderedSet(MagicMock(ff.FitnessFunction) for _ in range(num_goals))
+    solutions = [
+        chromosome_with_fitness(goals, [rng.randint(0, 3) for _ in goals])
+        for _ in range(40)
+    ]
+    comparator = DominanceComparator(goals=goals)
+    expected = []
+    remaining = list(solutions)
+    while remaining:
+        front = RankBasedPreferenceSorting._get_non_dominated_solutions(
+            remaining, comparator, 0
+        )
+        expected.append(front)
+        remaining = [element for element in remaining if element not in front]
+    result = RankBasedPreferenceSorting._non_dominated_sort(solutions, goals)
+    assert result == expected
+
+
+def test_compute_ranking_assignment_fast(ranking_function, chromosome_with_fitness):
+    goals = OrderedSet([MagicMock(ff.FitnessFunction), MagicMock(ff.FitnessFunction)])
+    chromosome_1, chromosome_2, chromosome_3, chromosome_4 = (
+        chromosome_with_fitness(goals, values)
+        for values in ([0.0, 2.0], [2.0, 0.0], [1.0, 1.0], [2.0, 2.0])
+    )
+    config.configuration.search_algorithm.population = 4
+    result = ranking_function.compute_ranking_assignment_fast(
+        [chromosome_1, chromosome_2, chromosome_3, chromosome_4], goals
+    )
+    assert result == RankedFronts(
+        fronts=[[chromosome_1, chromosome_2], [chromosome_3], [chromosome_4]]
+    )
+    assert chromosome_3.rank == 1
+    assert chromosome_4.rank == 2
@@ -74,6 +74,32 @@ def test_update_solution(objectives, chromosomes):
     assert chromosomes[1].get_is_covered.call_count == 4
 
 
+def test_update_removes_covered_goals_in_order(objectives):
+    chromosome = MagicMock(tcc.TestCaseChromosome)
+    chromosome.size.return_value = 1
+    chromosome.get_is_covered.side_effect = lambda goal: goal is objectives[0]
+    new_goal = MagicMock(ff.TestCaseFitnessFunction)
+    archive = CoverageArchive(objectives)
+    archive.add_goals(OrderedSet([new_goal]))
+    archive.update([chromosome])
+    assert list(archive.uncovered_goals) == [objectives[1], new_goal]
+    archive.reset()
+    assert list(archive.uncovered_goals) == [objectives[1], new_goal, objectives[0]]
+
+
+def test_epoch_changes_with_solutions(objectives):
+    chromosome = MagicMock(tcc.TestCaseChromosome)
+    chromosome.size.return_value = 1
+    chromosome.get_is_covered.side_effect = lambda goal: goal is objectives[0]
+    archive = CoverageArchive(objectives)
+    archive.update([chromosome])
+    assert archive.epoch == 1
+    archive.update([chromosome])
+    assert archive.epoch == 1
+    archive.reset()
+    assert archive.epoch == 2
+
+
 def test_population_pair():
     pair = MIOPopulationPair(0.5, MagicMock())
     assert pair == pair
@@ -0,0 +1,179 @@
+#  This file is part of Pynguin and CodaMOSA.
+#
+#  SPDX-FileCopyrightText: Microsoft, 2019–2022 Pynguin Contributors
+#
+#  SPDX-License-Identifier: MIT
+#
+from unittest.mock import MagicMock
+
+import pytest
+from ordered_set import OrderedSet
+
+import pynguin.configuration as config
+import pynguin.ga.computations as ff
+import pynguin.ga.testcasechromosome as tcc
+import pynguin.testcase.testcase as tc
+from pynguin.ga.operators.ranking.rankingfunction import RankBasedPreferenceSorting
+from pynguin.generation.algorithms.archive import CoverageArchive
+from pynguin.generation.algorithms.codamosastrategy import CodaMOSATestStrategy
+from pynguin.testcase.execution import ExecutionResult
+from pynguin.utils import randomness
+
+
+@pytest.fixture
+def codamosa_strategy():
+    config.configuration.search_algorithm.population = 1
+    return CodaMOSATestStrategy()
+
+
+def _executed_chromosome():
+    test_case = MagicMock(tc.TestCase)
+    test_case.clone.return_value = test_case
+    chromosome = tcc.TestCaseChromosome(test_case)
+    chromosome.set_last_execution_result(MagicMock(ExecutionResult))
+    chromosome.set_changed(False)
+    return chromosome
+
+
+def test_lookup_cached_execution(codamosa_strategy):
+    executed = _executed_chromosome()
+    codamosa_strategy._store_execution(executed)
+    offspring = tcc.TestCaseChromosome(executed.test_case)
+    assert codamosa_strategy._lookup_cached_execution(offspring)
+    assert not offspring.has_changed()
+    assert offspring.get_last_execution_result() is executed.get_last_execution_result()
+
+
+def test_lookup_cached_execution_miss(codamosa_strategy):
+    offspring = tcc.TestCaseChromosome(MagicMock(tc.TestCase))
+    assert not codamosa_strategy._lookup_cached_execution(offspring)
+    assert offspring.has_changed()
+    assert offspring.get_last_execution_result() is None
+
+
+def test_execute_changed_once_per_test_case(codamosa_strategy):
+    codamosa_strategy.executor = MagicMock()
+    test_case = MagicMock(tc.TestCase)
+    test_case.clone.return_value = test_case
+    executed = _executed_chromosome()
+    first, second = (tcc.TestCaseChromosome(test_case) for _ in range(2))
+    codamosa_strategy._execute_changed([executed, first, second])
+    codamosa_strategy.executor.execute.assert_called_once_with(test_case)
+    assert not first.has_changed()
+    assert not second.has_changed()
+    assert first.get_last_execution_result() is second.get_last_execution_result()
+
+
+def test_store_execution_evicts_least_recently_used(codamosa_strategy):
+    first, second, third, fourth, fifth = (_executed_chromosome() for _ in range(5))
+    for chromosome in (first, second, third, fourth, first, fifth):
+        codamosa_strategy._store_execution(chromosome)
+    assert list(codamosa_strategy._execution_cache) == [
+        third.test_case,
+        fourth.test_case,
+        first.test_case,
+        fifth.test_case,
+    ]
+
+
+def test_evolve_targeted_skips_duplicate_offspring(codamosa_strategy, mocker):
+    config.configuration.search_algorithm.population = 4
+    config.configuration.search_algorithm.crossover_rate = 0.0
+    config.configuration.codamosa.target_low_coverage_functions = True
+    test_case = MagicMock(tc.TestCase)
+    test_case.clone.return_value = test_case
+    test_case.size.return_value = 1
+    mocker.patch(
+        "pynguin.generation.algorithms.codamosastrategy.languagemodelseeding"
+        ".target_uncovered_functions",
+        return_value=[test_case],
+    )
+    codamosa_strategy.stopping_conditions = []
+    codamosa_strategy.test_factory = MagicMock()
+    codamosa_strategy._mutate = MagicMock()
+    codamosa_strategy.evolve_common = MagicMock()
+    codamosa_strategy.evolve_targeted(MagicMock())
+    (offspring,) = codamosa_strategy.evolve_common.call_args.args
+    assert [chromosome.test_case for chromosome in offspring] == [test_case]
+
+
+def test_evolve_common_two_goals(codamosa_strategy, mocker, chromosome_with_fitness):
+    config.configuration.search_algorithm.population = 4
+    goals = OrderedSet(
+        [MagicMock(ff.TestCaseFitnessFunction), MagicMock(ff.TestCaseFitnessFunction)]
+    )
+
+    def chromosome(*values):
+        result = chromosome_with_fitness(goals, values, spec=tcc.TestCaseChromosome)
+        result.get_is_covered.return_value = False
+        result.has_changed.return_value = False
+        return result
+
+    first_goal_best = chromosome(0.0, 3.0)
+    second_goal_best = chromosome(3.0, 0.0)
+    balanced = chromosome(1.0, 1.0)
+    dominated_1 = chromosome(2.0, 2.0)
+    dominated_2 = chromosome(1.0, 2.0)
+    extreme = chromosome(0.5, 2.5)
+    middle = chromosome(0.8, 1.5)
+    codamosa_strategy._archive = CoverageArchive(goals)
+    codamosa_strategy.ranking_function = RankBasedPreferenceSorting()
+    bi_objective_sort = mocker.spy(RankBasedPreferenceSorting, "_bi_objective_sort")
+    codamosa_strategy._population = [middle, dominated_1, dominated_2, balanced]
+    codamosa_strategy.evolve_common([first_goal_best, second_goal_best, extreme])
+    assert codamosa_strategy._population == [
+        first_goal_best,
+        second_goal_best,
+        balanced,
+        extreme,
+    ]
+    bi_objective_sort.assert_called_once()
+
+
+@pytest.mark.parametrize(
+    "changed,size,result", [(True, 1, True), (False, 1, False), (True, 0, False)]
+)
+def test_mutate_offspring(codamosa_strategy, changed, size, result):
+    offspring = MagicMock(tcc.TestCaseChromosome)
+    offspring.has_changed.return_value = changed
+    offspring.size.return_value = size
+    assert codamosa_strategy._mutate_offspring(offspring) is result
+    offspring.mutate.assert_called()
+
+
+def test_create_archive_suite_cached(codamosa_strategy):
+    goal = MagicMock(ff.TestCaseFitnessFunction)
+    codamosa_strategy._archive = CoverageArchive(OrderedSet([goal]))
+    suite = codamosa_strategy._create_archive_suite()
+    assert codamosa_strategy._create_archive_suite() is suite
+    chromosome = MagicMock(tcc.TestCaseChromosome)
+    chromosome.size.return_value = 1
+    chromosome.get_is_covered.return_value = True
+    codamosa_strategy._archive.update([chromosome])
+    updated = codamosa_strategy._create_archive_suite()
+    assert updated is not suite
+    assert updated.test_case_chromosomes == [chromosome]
+
+
+def test_evolve_targeted_draws_parents_in_batches(codamosa_strategy, mocker):
+    config.configuration.search_algorithm.population = 2
+    config.configuration.search_algorithm.crossover_rate = 0.0
+    config.configuration.codamosa.target_low_coverage_functions = True
+    test_case = MagicMock(tc.TestCase)
+    test_case.clone.return_value = test_case
+    mocker.patch(
+        "pynguin.generation.algorithms.codamosastrategy.languagemodelseeding"
+        ".target_uncovered_functions",
+        return_value=[test_case],
+    )
+    choices = mocker.spy(randomness, "choices")
+    codamosa_strategy.stopping_conditions = []
+    codamosa_strategy.test_factory = MagicMock()
+    # The first batch of four parents only yields rejected offspring
+    codamosa_strategy._mutate_offspring = MagicMock(
+        side_effect=[False, False, False, False, True, True]
+    )
+    codamosa_strategy.evolve_common = MagicMock()
+    codamosa_strategy.evolve_targeted(MagicMock())
+    assert choices.call_count == 2
+    assert codamosa_strategy._mutate_offspring.call_count == 6
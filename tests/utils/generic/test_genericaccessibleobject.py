@@ -4,15 +4,22 @@
 #
 #  SPDX-License-Identifier: LGPL-3.0-or-later
 #
+import copy
+import inspect
+import pickle
 from unittest.mock import MagicMock
 
 from pynguin.typeinference.strategy import InferredSignature
 from pynguin.utils.generic.genericaccessibleobject import (
+    KIND_FIELD,
+    KIND_METHOD,
+    KIND_STATIC_FIELD,
     GenericAccessibleObject,
     GenericConstructor,
     GenericField,
     GenericFunction,
     GenericMethod,
+    GenericStaticField,
 )
 from tests.fixtures.accessibles.accessible import SomeType
 
@@ -140,3 +147,61 @@ def test_generic_field_is_field(field_mock):
 
 def test_generic_field_dependencies(field_mock):
     assert field_mock.get_dependencies() == {SomeType}
+
+
+def test_generic_field_has_no_dict(field_mock):
+    assert not hasattr(field_mock, "__dict__")
+
+
+def test_generic_field_copy(field_mock):
+    assert copy.deepcopy(field_mock) == field_mock
+
+
+def test_generic_field_pickle():
+    # Fixture modules may be reloaded by other tests, thus use a builtin owner.
+    field = GenericField(complex, "real", float)
+    assert pickle.loads(pickle.dumps(field)) == field
+
+
+def test_generic_method_copy(method_mock):
+    assert copy.copy(method_mock) == method_mock
+    assert copy.copy(method_mock).method_name == method_mock.method_name
+
+
+def test_generic_method_dependencies_cached(method_mock):
+    assert method_mock.get_dependencies() is method_mock.get_dependencies()
+
+
+def test_generic_function_dependencies_follow_signature_update():
+    def function(value):
+        pass  # pragma: no cover
+
+    signature = InferredSignature(
+        signature=inspect.signature(function), parameters={"value": None}
+    )
+    generic = GenericFunction(function, signature)
+    assert generic.get_dependencies() == frozenset()
+    signature.update_parameter_type("value", int)
+    assert generic.get_dependencies() == {int}
+
+
+def test_generic_field_dependencies_cached(field_mock):
+    assert field_mock.get_dependencies() is field_mock.get_dependencies()
+
+
+def test_generic_field_eq_other_field(field_mock):
+    second = GenericField(SomeType, "x", float)
+    assert field_mock != second
+
+
+def test_generic_field_hash_equal(field_mock):
+    assert hash(field_mock) == hash(GenericField(SomeType, "y", float))
+
+
+def test_kind_matches_predicates(method_mock, field_mock):
+    assert method_mock.KIND == KIND_METHOD
+    assert method_mock.is_method()
+    assert field_mock.KIND == KIND_FIELD
+    assert field_mock.is_field()
+    static_field = GenericStaticField(complex, "real", float)
+    assert static_field.KIND == KIND_STATIC_FIELD